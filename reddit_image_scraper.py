@@ -19,29 +19,116 @@ Auteur: Assistant IA
 Version: 1.0.0
 """
 
+from __future__ import annotations
+
 import os
-import re
-import sys
 import json
 import time
+import shutil
+import base64
 import hashlib
 import argparse
-import urllib.request
+import threading
+import http.client
 import urllib.parse
-import urllib.error
+import urllib.request
 from pathlib import Path
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Set
+from functools import lru_cache
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, BinaryIO, Iterator, List, Optional, Dict, Any, Set, Tuple
 import ssl
+import socket
+
+# asyncio et aiohttp sont importés à la demande, seulement pour le mode asynchrone
+if TYPE_CHECKING:
+    import asyncio
+    import aiohttp
+
+# orjson est optionnel: parsing JSON plus rapide s'il est installé
+# (orjson.JSONDecodeError hérite de json.JSONDecodeError)
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+
+def _loads(data: bytes) -> Any:
+    """Décode un document JSON depuis des octets bruts."""
+    return _json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode un objet en JSON (octets UTF-8)."""
+    if _json is json:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    return _json.dumps(obj)
+
+
+def _has_aiohttp() -> bool:
+    """
+    Indique si aiohttp est utilisable (dépendance optionnelle).
+    
+    Returns:
+        True si aiohttp s'importe correctement: téléchargements asynchrones,
+        sinon repli sur le pool de threads
+    """
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(url: str) -> urllib.parse.ParseResult:
+    """Analyse une URL (mise en cache: la même URL sert au filtrage et au nommage)."""
+    return urllib.parse.urlparse(url)
+
+
+def _url_key(url: str) -> str:
+    """Empreinte courte d'une URL pour l'index des téléchargements."""
+    # blake2b est plus rapide que sha1/sha256, aucune résistance cryptographique n'est requise
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# Caractères interdits dans les noms de fichiers (table de suppression pour str.translate)
+_UNSAFE_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+# Extensions reconnues pour les fichiers téléchargés
+_FILE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp4')
+
+# Suffixe des téléchargements en cours
+_PARTIAL_SUFFIX = '.part'
+
+# Taille des blocs lus/écrits pendant un téléchargement (et du tampon
+# d'écriture): moins d'appels système write() par image
+_CHUNK_SIZE = 1 << 20
+
+# Index des URLs déjà téléchargées, à la racine du dossier de sortie
+_INDEX_FILENAME = '_index.json'
+
+# Nombre de nouveaux téléchargements entre deux sauvegardes de l'index
+_INDEX_FLUSH_EVERY = 50
+
+# Intervalle minimum entre deux rafraîchissements de la barre de progression
+_PROGRESS_INTERVAL = 0.05
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Configuration
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+# Plafond du nombre de téléchargements parallèles: au-delà, Reddit et Imgur
+# finissent par limiter le débit (rate limiting)
+MAX_WORKERS = 64
+
+# Téléchargements simultanés maximum vers un même hôte
+MAX_PER_HOST = 8
+
+
+@dataclass(slots=True, frozen=True)
 class ScraperConfig:
     """Configuration du scraper."""
     subreddit: str
@@ -53,17 +140,355 @@ class ScraperConfig:
     min_height: int = 0
     min_score: int = 0
     include_nsfw: bool = False
-    max_workers: int = 5
+    max_workers: int = 16
+    max_bytes: int = 100 * 1024 * 1024  # Taille maximum d'un fichier (0 = illimitée)
     delay: float = 0.5  # Délai entre requêtes pour éviter le rate limiting
     skip_existing: bool = True
     verbose: bool = True
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Réseau
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    """Connexion HTTPS qui reprend la session TLS précédente de l'hôte."""
+    
+    def __init__(
+        self,
+        *args,
+        server_hostname: str,
+        tls_session: Optional[ssl.SSLSession] = None,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        # Hôte visé (différent de self.host quand on passe par un proxy)
+        self.server_hostname = server_hostname
+        self.tls_session = tls_session
+    
+    def connect(self) -> None:
+        # Connexion TCP (et tunnel CONNECT si un proxy est configuré)
+        http.client.HTTPConnection.connect(self)
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=self.server_hostname, session=self.tls_session
+        )
+
+
+class ConnectionPool:
+    """
+    Pool de connexions HTTP(S) persistantes (keep-alive).
+    
+    Les connexions inactives sont conservées par hôte et partagées entre
+    les threads, ce qui évite une poignée de main TCP+TLS par requête.
+    """
+    
+    REDIRECT_CODES = {301, 302, 303, 307, 308}
+    
+    # Durée de validité des résolutions DNS en cache (secondes)
+    DNS_TTL = 300
+    
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        maxsize: int = 10,
+        timeout: float = 30,
+        max_redirects: int = 5
+    ):
+        self.headers = dict(headers or {})
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        
+        # Contexte SSL par défaut (certificats système vérifiés)
+        self.ssl_context = ssl.create_default_context()
+        
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        
+        # Résolutions DNS et sessions TLS partagées entre les connexions
+        self._dns_cache: Dict[Tuple[str, int], Tuple[float, List[Tuple]]] = {}
+        self._tls_sessions: Dict[str, ssl.SSLSession] = {}
+        
+        # Proxys de l'environnement (HTTP_PROXY, HTTPS_PROXY, NO_PROXY), comme urllib
+        self.proxies = urllib.request.getproxies()
+        self._proxy_cache: Dict[Tuple[str, str, int], Optional[Tuple[str, int, Dict[str, str]]]] = {}
+    
+    @staticmethod
+    def _split_url(url: str) -> Tuple[Tuple[str, str, int], str]:
+        """Découpe une URL en (schéma, hôte, port) et chemin de requête."""
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme.lower()
+        
+        if scheme not in ('http', 'https') or not parsed.hostname:
+            raise ValueError(f"URL non supportée: {url}")
+        
+        port = parsed.port or (443 if scheme == 'https' else 80)
+        target = parsed.path or '/'
+        if parsed.query:
+            target += '?' + parsed.query
+        
+        return (scheme, parsed.hostname, port), target
+    
+    def _proxy_for(self, key: Tuple[str, str, int]) -> Optional[Tuple[str, int, Dict[str, str]]]:
+        """
+        Détermine le proxy à utiliser pour un hôte.
+        
+        Args:
+            key: Tuple (schéma, hôte, port) de la requête
+            
+        Returns:
+            Tuple (hôte du proxy, port, en-têtes pour le proxy),
+            ou None pour une connexion directe
+        """
+        if key in self._proxy_cache:
+            return self._proxy_cache[key]
+        
+        scheme, host, _ = key
+        proxy = self.proxies.get(scheme)
+        result = None
+        
+        if proxy and not urllib.request.proxy_bypass(host):
+            parsed = urllib.parse.urlsplit(proxy if '://' in proxy else f"http://{proxy}")
+            headers = {}
+            if parsed.username:
+                credentials = (
+                    f"{urllib.parse.unquote(parsed.username)}:"
+                    f"{urllib.parse.unquote(parsed.password or '')}"
+                )
+                token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+                headers['Proxy-Authorization'] = f"Basic {token}"
+            result = (parsed.hostname, parsed.port or 80, headers)
+        
+        self._proxy_cache[key] = result
+        return result
+    
+    def _resolve(self, host: str, port: int) -> List[Tuple]:
+        """Résout un hôte, en réutilisant le cache DNS tant qu'il est valide."""
+        now = time.monotonic()
+        
+        with self._lock:
+            cached = self._dns_cache.get((host, port))
+        if cached and now - cached[0] < self.DNS_TTL:
+            return cached[1]
+        
+        addresses = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        with self._lock:
+            self._dns_cache[(host, port)] = (now, addresses)
+        
+        return addresses
+    
+    def _create_connection(
+        self,
+        address: Tuple[str, int],
+        timeout: float,
+        source_address: Optional[Tuple[str, int]] = None
+    ) -> socket.socket:
+        """Équivalent de socket.create_connection utilisant le cache DNS."""
+        host, port = address
+        error: Optional[OSError] = None
+        
+        for family, sock_type, proto, _, sockaddr in self._resolve(host, port):
+            sock = socket.socket(family, sock_type, proto)
+            try:
+                sock.settimeout(timeout)
+                if source_address:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as e:
+                error = e
+                sock.close()
+        
+        # Aucune adresse joignable: la résolution sera refaite la prochaine fois
+        with self._lock:
+            self._dns_cache.pop((host, port), None)
+        
+        raise error or OSError(f"Aucune adresse pour {host}")
+    
+    def _acquire(self, key: Tuple[str, str, int]) -> Tuple[http.client.HTTPConnection, bool]:
+        """Récupère une connexion inactive ou en crée une nouvelle."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        
+        scheme, host, port = key
+        proxy = self._proxy_for(key)
+        conn_host, conn_port = (proxy[0], proxy[1]) if proxy else (host, port)
+        
+        if scheme == 'https':
+            conn = _HTTPSConnection(
+                conn_host, conn_port, timeout=self.timeout, context=self.ssl_context,
+                server_hostname=host, tls_session=self._tls_sessions.get(host)
+            )
+            if proxy:
+                # HTTPS via proxy: tunnel CONNECT vers l'hôte visé
+                conn.set_tunnel(host, port, headers=proxy[2])
+        else:
+            conn = http.client.HTTPConnection(conn_host, conn_port, timeout=self.timeout)
+        
+        # Attribut privé de http.client: HTTPConnection.connect() ouvre le socket
+        # via self._create_connection (fixé à socket.create_connection dans
+        # __init__). On le remplace pour passer par le cache DNS.
+        conn._create_connection = self._create_connection
+        return conn, False
+    
+    def _getresponse(
+        self,
+        key: Tuple[str, str, int],
+        conn: http.client.HTTPConnection
+    ) -> http.client.HTTPResponse:
+        """Lit la réponse et conserve la session TLS pour les connexions suivantes."""
+        # Sur « Connection: close », getresponse() ferme déjà la connexion
+        # (conn.sock devient None): garder le socket pour lire sa session
+        sock = conn.sock
+        response = conn.getresponse()
+        
+        # Avec TLS 1.3, le ticket de session n'est envoyé qu'avec la première
+        # réponse: une session sans ticket ne permet pas la reprise
+        session = getattr(sock, 'session', None)
+        if session is not None and session.has_ticket:
+            self._tls_sessions[key[1]] = session
+        
+        return response
+    
+    def _put_idle(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        """Range une connexion ouverte parmi les connexions inactives."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        
+        conn.close()
+    
+    def _release(
+        self,
+        key: Tuple[str, str, int],
+        conn: http.client.HTTPConnection,
+        response: http.client.HTTPResponse
+    ) -> None:
+        """Remet la connexion dans le pool si elle est réutilisable."""
+        # Une réponse non lue entièrement rend la connexion inutilisable
+        if response.isclosed() and conn.sock is not None:
+            self._put_idle(key, conn)
+        else:
+            conn.close()
+    
+    def prime(self, hosts: List[str]) -> None:
+        """
+        Prépare en arrière-plan une connexion HTTPS vers chaque hôte.
+        
+        Une requête HEAD est envoyée et lue entièrement: la résolution DNS,
+        la poignée de main TLS et la réception du ticket de session sont
+        ainsi faites pendant le listing, avant les premiers téléchargements.
+        
+        Args:
+            hosts: Hôtes à préparer
+        """
+        def connect(host: str) -> None:
+            key = ('https', host, 443)
+            try:
+                conn, response = self._send(key, '/', self.headers, method='HEAD')
+            except (OSError, http.client.HTTPException):
+                return
+            
+            try:
+                response.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                return
+            self._release(key, conn, response)
+        
+        for host in hosts:
+            threading.Thread(target=connect, args=(host,), daemon=True).start()
+    
+    def _send(
+        self,
+        key: Tuple[str, str, int],
+        target: str,
+        headers: Dict[str, str],
+        method: str = 'GET'
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Envoie une requête (GET par défaut) sur une connexion du pool."""
+        # HTTP via proxy: URL absolue dans la ligne de requête
+        proxy = self._proxy_for(key)
+        if proxy and key[0] == 'http':
+            scheme, host, port = key
+            target = f"http://{host}{'' if port == 80 else f':{port}'}{target}"
+            headers = {**headers, **proxy[2]}
+        
+        conn, reused = self._acquire(key)
+        
+        try:
+            try:
+                conn.request(method, target, headers=headers)
+                return conn, self._getresponse(key, conn)
+            except ConnectionError:
+                # Le serveur a pu fermer la connexion inactive: on réessaie
+                # une fois sur une connexion neuve
+                if not reused:
+                    raise
+                conn.close()
+                
+                # Reprendre la session TLS la plus récente de l'hôte
+                if isinstance(conn, _HTTPSConnection):
+                    conn.tls_session = self._tls_sessions.get(key[1])
+                
+                conn.request(method, target, headers=headers)
+                return conn, self._getresponse(key, conn)
+        except Exception:
+            conn.close()
+            raise
+    
+    @contextmanager
+    def open(self, url: str, headers: Optional[Dict[str, str]] = None) -> Iterator[http.client.HTTPResponse]:
+        """
+        Ouvre une URL en suivant les redirections.
+        
+        Args:
+            url: URL à requêter
+            headers: En-têtes propres à cette requête
+            
+        Yields:
+            Réponse HTTP (le code de statut n'est pas vérifié)
+        """
+        merged = {**self.headers, **(headers or {})}
+        
+        for _ in range(self.max_redirects + 1):
+            key, target = self._split_url(url)
+            conn, response = self._send(key, target, merged)
+            
+            location = response.getheader('Location')
+            if response.status not in self.REDIRECT_CODES or not location:
+                break
+            
+            response.read()
+            self._release(key, conn, response)
+            url = urllib.parse.urljoin(url, location)
+        else:
+            raise http.client.HTTPException(f"Trop de redirections: {url}")
+        
+        try:
+            yield response
+        finally:
+            self._release(key, conn, response)
+    
+    def close(self) -> None:
+        """Ferme toutes les connexions inactives."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Classes principales
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RedditPost:
     """Représente un post Reddit."""
     id: str
@@ -77,12 +502,16 @@ class RedditPost:
     is_nsfw: bool
     width: int = 0
     height: int = 0
+    filename: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Instance figée: le nom de fichier est calculé une seule fois ici
+        object.__setattr__(self, 'filename', self._build_filename())
     
-    @property
-    def filename(self) -> str:
+    def _build_filename(self) -> str:
         """Génère un nom de fichier sécurisé."""
         # Nettoyer le titre
-        safe_title = re.sub(r'[<>:"/\\|?*]', '', self.title)
+        safe_title = self.title.translate(_UNSAFE_FILENAME_CHARS)
         safe_title = safe_title[:80].strip()
         
         # Extension depuis l'URL
@@ -92,12 +521,10 @@ class RedditPost:
     
     def _get_extension(self) -> str:
         """Extrait l'extension du fichier."""
-        parsed = urllib.parse.urlparse(self.url)
-        path = parsed.path.lower()
+        path = _parse_url(self.url).path.lower()
         
-        for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp4']:
-            if path.endswith(ext):
-                return ext
+        if path.endswith(_FILE_EXTENSIONS):
+            return next(ext for ext in _FILE_EXTENSIONS if path.endswith(ext))
         
         # Par défaut
         return '.jpg'
@@ -127,7 +554,20 @@ class RedditScraper:
     }
     
     # Extensions d'images
-    IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+    IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+    
+    # Hôtes d'images préparés au démarrage (DNS + TLS)
+    PRIME_HOSTS = ['i.redd.it', 'preview.redd.it', 'i.imgur.com']
+    
+    # En-têtes des requêtes de téléchargement d'image
+    DOWNLOAD_HEADERS = {
+        'Referer': 'https://www.reddit.com/',
+    }
+    
+    # Nouvelles tentatives sur les erreurs temporaires
+    MAX_RETRIES = 5
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    MAX_BACKOFF = 60  # Attente maximum entre deux tentatives (secondes)
     
     def __init__(self, config: ScraperConfig):
         self.config = config
@@ -144,26 +584,70 @@ class RedditScraper:
         self.output_path = Path(config.output_dir) / config.subreddit
         self.output_path.mkdir(parents=True, exist_ok=True)
         
+        # Index des URLs téléchargées (partagé entre subreddits: évite les reposts)
+        self.index_path = Path(config.output_dir) / _INDEX_FILENAME
+        self.url_index: Dict[str, str] = {}
+        self._index_lock = threading.Lock()
+        self._index_unsaved = 0
+        
+        # Toujours charger l'index: il est partagé entre subreddits et serait
+        # sinon réécrit avec les seules entrées de cette exécution
+        self._load_url_index()
+        
         # Charger les fichiers existants si skip_existing
         if config.skip_existing:
             self._load_existing_files()
         
-        # Configuration SSL pour éviter les erreurs de certificat
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.check_hostname = False
-        self.ssl_context.verify_mode = ssl.CERT_NONE
+        # Limite de concurrence par hôte (i.redd.it, i.imgur.com, ...)
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_lock = threading.Lock()
+        
+        # Connexions persistantes partagées par tous les téléchargements
+        self.pool = ConnectionPool(
+            headers={'User-Agent': self.USER_AGENT},
+            maxsize=config.max_workers,
+            timeout=30
+        )
     
     def _load_existing_files(self) -> None:
         """Charge la liste des fichiers déjà téléchargés."""
-        for file in self.output_path.glob('*'):
-            if file.is_file():
-                # Extraire l'ID du post depuis le nom de fichier
-                post_id = file.stem.split('_')[0]
-                self.downloaded.add(post_id)
+        # os.scandir réutilise le type lu avec le répertoire (pas de stat par fichier)
+        with os.scandir(self.output_path) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and not entry.name.endswith(_PARTIAL_SUFFIX):
+                    # Extraire l'ID du post depuis le nom de fichier
+                    post_id = entry.name.split('_', 1)[0]
+                    self.downloaded.add(post_id)
         
         if self.downloaded and self.config.verbose:
             print(f"📁 {len(self.downloaded)} fichiers existants trouvés")
     
+    def _load_url_index(self) -> None:
+        """Charge l'index des URLs déjà téléchargées."""
+        try:
+            index = _loads(self.index_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Index ignoré ({self.index_path}): {e}")
+            return
+        
+        if isinstance(index, dict):
+            self.url_index.update(index)
+    
+    def _save_url_index(self) -> None:
+        """Écrit l'index des URLs de façon atomique."""
+        with self._index_lock:
+            data = _dumps(self.url_index)
+            self._index_unsaved = 0
+        
+        partial_path = self.index_path.with_name(self.index_path.name + _PARTIAL_SUFFIX)
+        try:
+            partial_path.write_bytes(data)
+            os.replace(partial_path, self.index_path)
+        except OSError as e:
+            print(f"⚠️  Impossible d'enregistrer l'index: {e}")
+    
     def _make_request(self, url: str) -> Optional[Dict]:
         """
         Effectue une requête HTTP et retourne le JSON.
@@ -175,26 +659,33 @@ class RedditScraper:
             Données JSON ou None si erreur
         """
         headers = {
-            'User-Agent': self.USER_AGENT,
             'Accept': 'application/json',
             'Accept-Language': 'en-US,en;q=0.9',
         }
         
         try:
-            request = urllib.request.Request(url, headers=headers)
+            for attempt in range(self.MAX_RETRIES):
+                with self.pool.open(url, headers) as response:
+                    data = response.read()
+                
+                if response.status not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES - 1:
+                    break
+                
+                wait = self._retry_delay(response, attempt)
+                if response.status == 429:
+                    print(f"⚠️  Rate limited! Attente de {wait:.0f} secondes...")
+                else:
+                    print(f"⚠️  Erreur HTTP {response.status}, nouvel essai dans {wait:.0f} secondes...")
+                time.sleep(wait)
             
-            with urllib.request.urlopen(request, timeout=30, context=self.ssl_context) as response:
-                data = response.read().decode('utf-8')
-                return json.loads(data)
+            if response.status >= 400:
+                print(f"❌ Erreur HTTP {response.status}: {url}")
+                return None
+            
+            return _loads(data)
                 
-        except urllib.error.HTTPError as e:
-            if e.code == 429:
-                print(f"⚠️  Rate limited! Attente de 60 secondes...")
-                time.sleep(60)
-                return self._make_request(url)
-            print(f"❌ Erreur HTTP {e.code}: {url}")
-        except urllib.error.URLError as e:
-            print(f"❌ Erreur URL: {e.reason}")
+        except (OSError, http.client.HTTPException) as e:
+            print(f"❌ Erreur réseau: {e}")
         except json.JSONDecodeError:
             print(f"❌ Erreur parsing JSON: {url}")
         except Exception as e:
@@ -202,6 +693,31 @@ class RedditScraper:
         
         return None
     
+    def _retry_delay(self, response: http.client.HTTPResponse, attempt: int) -> float:
+        """
+        Calcule l'attente avant une nouvelle tentative.
+        
+        Args:
+            response: Réponse en erreur
+            attempt: Numéro de la tentative (à partir de 0)
+            
+        Returns:
+            Délai en secondes, plafonné à MAX_BACKOFF: pour un 429, celui
+            annoncé par le serveur s'il y en a un, sinon un backoff exponentiel
+        """
+        # Reddit envoie X-Ratelimit-Reset sur presque toutes les réponses:
+        # il ne fait foi que pour un rate limiting (429), pas pour un 5xx
+        if response.status == 429:
+            for header in ('Retry-After', 'X-Ratelimit-Reset'):
+                value = response.getheader(header)
+                if value:
+                    try:
+                        return min(float(self.MAX_BACKOFF), max(0.0, float(value)))
+                    except ValueError:
+                        pass  # Format date HTTP non géré
+        
+        return float(min(self.MAX_BACKOFF, 2 ** attempt))
+    
     def _build_url(self, after: Optional[str] = None) -> str:
         """
         Construit l'URL de requête Reddit.
@@ -228,61 +744,62 @@ class RedditScraper:
         query = urllib.parse.urlencode(params)
         return f"{base}?{query}"
     
-    def _is_image_url(self, url: str) -> bool:
-        """Vérifie si l'URL pointe vers une image."""
-        if not url:
-            return False
-        
-        parsed = urllib.parse.urlparse(url)
-        
-        # Vérifier le domaine
-        if parsed.netloc in self.IMAGE_DOMAINS:
-            return True
-        
-        # Vérifier l'extension
-        path_lower = parsed.path.lower()
-        return any(path_lower.endswith(ext) for ext in self.IMAGE_EXTENSIONS)
+    def _is_image_url(self, parsed: urllib.parse.ParseResult) -> bool:
+        """Vérifie si l'URL (déjà analysée) pointe vers une image."""
+        # Vérifier le domaine, puis l'extension (endswith accepte un tuple)
+        return (
+            parsed.netloc in self.IMAGE_DOMAINS
+            or parsed.path.lower().endswith(self.IMAGE_EXTENSIONS)
+        )
     
-    def _extract_image_url(self, post_data: Dict) -> Optional[str]:
+    def _extract_media(self, post_data: Dict) -> Optional[Tuple[str, int, int]]:
         """
-        Extrait l'URL de l'image depuis les données du post.
+        Extrait l'URL de l'image et ses dimensions depuis les données du post.
         
         Args:
             post_data: Données du post Reddit
             
         Returns:
-            URL de l'image ou None
+            Tuple (url, largeur, hauteur) ou None
         """
         url = post_data.get('url', '')
         
+        # Source de la preview Reddit (parcourue une seule fois par post)
+        source = {}
+        preview = post_data.get('preview', {})
+        if preview:
+            images = preview.get('images', [])
+            if images:
+                source = images[0].get('source', {})
+        
+        # Dimensions (si disponibles)
+        width = source.get('width', 0)
+        height = source.get('height', 0)
+        
         # URL directe vers une image
-        if self._is_image_url(url):
-            return url
+        if url and self._is_image_url(_parse_url(url)):
+            return url, width, height
         
         # Reddit gallery
         if post_data.get('is_gallery'):
             media_metadata = post_data.get('media_metadata', {})
             if media_metadata:
                 # Prendre la première image
-                first_item = list(media_metadata.values())[0]
-                if 's' in first_item:
-                    return first_item['s'].get('u', '').replace('&amp;', '&')
+                first_item = next(iter(media_metadata.values()), None)
+                if first_item is not None and 's' in first_item:
+                    gallery_url = first_item['s'].get('u', '').replace('&amp;', '&')
+                    return (gallery_url, width, height) if gallery_url else None
         
         # Preview Reddit
-        preview = post_data.get('preview', {})
-        if preview:
-            images = preview.get('images', [])
-            if images:
-                source = images[0].get('source', {})
-                preview_url = source.get('url', '').replace('&amp;', '&')
-                if preview_url:
-                    return preview_url
+        preview_url = source.get('url', '').replace('&amp;', '&')
+        if preview_url:
+            return preview_url, width, height
         
-        # Imgur sans extension
-        if 'imgur.com' in url and not self._is_image_url(url):
+        # Imgur sans extension (l'URL n'est pas une image directe, testé plus haut)
+        if 'imgur.com' in url:
             # Essayer d'ajouter .jpg
             if '/a/' not in url and '/gallery/' not in url:
-                return url + '.jpg'
+                return url + '.jpg', width, height
         
         return None
     
@@ -298,37 +815,26 @@ class RedditScraper:
         """
         data = post_data.get('data', {})
         
-        # Filtrer les posts non-image
-        if data.get('is_self', True):
+        # Filtrer les posts non-image (un champ absent n'exclut pas le post)
+        if data.get('is_self') or data.get('is_video'):
             return None
         
-        if data.get('is_video', True):
+        # Filtrer NSFW si non inclus (un champ absent est traité comme NSFW)
+        is_nsfw = data.get('over_18', True)
+        if is_nsfw and not self.config.include_nsfw:
             return None
         
-        # Filtrer NSFW si non inclus
-        if data.get('over_18', True) and not self.config.include_nsfw:
-            return None
-        
-        # Extraire l'URL de l'image
-        image_url = self._extract_image_url(data)
-        if not image_url:
-            return None
-        
-        # Filtrer par score
+        # Filtrer par score avant d'analyser les médias (test le moins coûteux)
         score = data.get('score', 0)
         if score < self.config.min_score:
             return None
         
-        # Dimensions (si disponibles)
-        width = 0
-        height = 0
-        preview = data.get('preview', {})
-        if preview:
-            images = preview.get('images', [])
-            if images:
-                source = images[0].get('source', {})
-                width = source.get('width', 0)
-                height = source.get('height', 0)
+        # Extraire l'URL de l'image et ses dimensions
+        media = self._extract_media(data)
+        if not media:
+            return None
+        
+        image_url, width, height = media
         
         # Filtrer par dimensions
         if width and self.config.min_width and width < self.config.min_width:
@@ -345,70 +851,175 @@ class RedditScraper:
             permalink=data.get('permalink', ''),
             score=score,
             created_utc=data.get('created_utc', 0),
-            is_nsfw=data.get('over_18', True),
+            is_nsfw=is_nsfw,
             width=width,
             height=height
         )
     
-    def fetch_posts(self) -> List[RedditPost]:
+    def _fetch_page(
+        self,
+        after: Optional[str] = None,
+        delay: float = 0
+    ) -> Tuple[Optional[List[RedditPost]], Optional[str]]:
         """
-        Récupère les posts du subreddit.
+        Récupère et analyse une page de listing.
         
+        Args:
+            after: Token de pagination
+            delay: Attente avant la requête (anti rate-limit)
+            
         Returns:
-            Liste des posts valides
+            Tuple (posts valides, token de la page suivante),
+            posts valant None si la requête a échoué
+        """
+        if delay:
+            time.sleep(delay)
+        
+        data = self._make_request(self._build_url(after))
+        
+        if not data:
+            return None, None
+        
+        listing = data.get('data', {})
+        children = listing.get('children', [])
+        
+        if not children:
+            return [], None
+        
+        posts = [post for post in map(self._parse_post, children) if post]
+        return posts, listing.get('after')
+    
+    def iter_posts(self) -> Iterator[RedditPost]:
+        """
+        Parcourt les posts du subreddit au fil de la pagination.
+        
+        La page suivante est préchargée en arrière-plan pendant que la page
+        courante est consommée. Les pages restent chaînées par le token
+        'after', une seule requête de listing est donc en vol à la fois.
+        
+        Yields:
+            Posts valides, dès que leur page est analysée
         """
-        posts = []
-        after = None
         fetched = 0
+        page = 1
+        
+        # Identifiants déjà fournis: un post peut réapparaître sur la page
+        # suivante si le listing bouge pendant la pagination
+        yielded: Set[str] = set()
         
         print(f"\n🔍 Recherche d'images dans r/{self.config.subreddit}...")
         print(f"   Tri: {self.config.sort} | Limite: {self.config.limit}")
         
-        while fetched < self.config.limit:
-            url = self._build_url(after)
-            
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
             if self.config.verbose:
-                print(f"   📡 Requête: page {len(posts) // 100 + 1}...")
-            
-            data = self._make_request(url)
-            
-            if not data:
-                break
-            
-            children = data.get('data', {}).get('children', [])
+                print(f"   📡 Requête: page {page}...")
             
-            if not children:
-                break
+            pending = prefetcher.submit(self._fetch_page)
             
-            for child in children:
-                if fetched >= self.config.limit:
+            while pending is not None:
+                posts, after = pending.result()
+                pending = None
+                
+                if posts is None:
                     break
                 
-                post = self._parse_post(child)
+                # Précharger la page suivante si la limite ne sera pas atteinte
+                new_count = sum(
+                    1 for post in posts
+                    if post.id not in self.downloaded and post.id not in yielded
+                )
+                if after and fetched + new_count < self.config.limit:
+                    page += 1
+                    
+                    if self.config.verbose:
+                        print(f"   📡 Requête: page {page}...")
+                    
+                    # Délai anti rate-limit appliqué dans le thread de préchargement
+                    pending = prefetcher.submit(self._fetch_page, after, self.config.delay)
                 
-                if post:
+                for post in posts:
+                    if fetched >= self.config.limit:
+                        break
+                    
+                    # Doublon dans ce même parcours: déjà en cours de téléchargement
+                    if post.id in yielded:
+                        continue
+                    
                     # Vérifier si déjà téléchargé
                     if post.id in self.downloaded:
                         self.stats['skipped'] += 1
                         continue
                     
-                    posts.append(post)
+                    self.stats['found'] += 1
                     fetched += 1
-            
-            # Pagination
-            after = data.get('data', {}).get('after')
-            if not after:
-                break
-            
-            # Délai anti rate-limit
-            time.sleep(self.config.delay)
+                    yielded.add(post.id)
+                    yield post
+    
+    def fetch_posts(self) -> List[RedditPost]:
+        """
+        Récupère les posts du subreddit.
         
-        self.stats['found'] = len(posts)
+        Returns:
+            Liste des posts valides
+        """
+        posts = list(self.iter_posts())
         print(f"   ✅ {len(posts)} images trouvées")
         
         return posts
     
-    def _download_image(self, post: RedditPost) -> bool:
+    def _is_known(self, post: RedditPost, url_key: str) -> bool:
+        """
+        Vérifie si une image est déjà présente sur disque.
+        
+        Args:
+            post: Post Reddit à télécharger
+            url_key: Empreinte de l'URL de l'image
+            
+        Returns:
+            True si le post a déjà été téléchargé (ensemble chargé au
+            démarrage, sans accès disque), ou si la même URL l'a été via
+            un autre post (repost, crosspost); toujours False avec
+            skip_existing désactivé
+        """
+        if not self.config.skip_existing:
+            return False
+        
+        if post.id in self.downloaded:
+            return True
+        
+        known = self.url_index.get(url_key)
+        return bool(known) and (self.index_path.parent / known).exists()
+    
+    def _record_download(self, url_key: str, filepath: Path) -> None:
+        """Ajoute un téléchargement réussi à l'index des URLs."""
+        with self._index_lock:
+            self.url_index[url_key] = filepath.relative_to(self.index_path.parent).as_posix()
+            self._index_unsaved += 1
+    
+    def _host_semaphore(self, host: str) -> threading.Semaphore:
+        """Retourne le sémaphore limitant les téléchargements vers un hôte."""
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(MAX_PER_HOST)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+    
+    def _download_image(self, post: RedditPost) -> Optional[bool]:
+        """
+        Télécharge une image en respectant la limite de concurrence par hôte.
+        
+        Args:
+            post: Post Reddit contenant l'URL
+            
+        Returns:
+            True si téléchargement réussi, False en cas d'échec,
+            None si l'image était déjà présente
+        """
+        with self._host_semaphore(_parse_url(post.url).netloc):
+            return self._fetch_image(post)
+    
+    def _fetch_image(self, post: RedditPost) -> Optional[bool]:
         """
         Télécharge une image.
         
@@ -416,32 +1027,52 @@ class RedditScraper:
             post: Post Reddit contenant l'URL
             
         Returns:
-            True si téléchargement réussi
+            True si téléchargement réussi, False en cas d'échec,
+            None si l'image était déjà présente
         """
         filepath = self.output_path / post.filename
+        url_key = _url_key(post.url)
         
         # Éviter les doublons
-        if filepath.exists():
-            return True
-        
-        headers = {
-            'User-Agent': self.USER_AGENT,
-            'Referer': 'https://www.reddit.com/',
-        }
+        if self._is_known(post, url_key):
+            return None
         
         try:
-            request = urllib.request.Request(post.url, headers=headers)
-            
-            with urllib.request.urlopen(request, timeout=30, context=self.ssl_context) as response:
+            with self.pool.open(post.url, self.DOWNLOAD_HEADERS) as response:
+                if response.status != 200:
+                    if self.config.verbose:
+                        print(f"   ❌ Erreur: {post.id} - HTTP {response.status}")
+                    return False
+                
                 # Vérifier le content-type
                 content_type = response.headers.get('Content-Type', '')
                 if not content_type.startswith('image/'):
                     return False
                 
-                # Télécharger
-                with open(filepath, 'wb') as f:
-                    f.write(response.read())
+                # Refuser les fichiers trop volumineux avant de les télécharger
+                size = response.length
+                if size and self.config.max_bytes and size > self.config.max_bytes:
+                    if self.config.verbose:
+                        print(f"   ⚠️  Ignorée: {post.id} - {size / (1024 * 1024):.1f} Mo")
+                    return False
                 
+                # Télécharger par blocs dans un fichier temporaire, renommé
+                # seulement une fois complet
+                partial_path = filepath.with_name(filepath.name + _PARTIAL_SUFFIX)
+                try:
+                    with self._open_partial(partial_path, size) as f:
+                        shutil.copyfileobj(response, f, _CHUNK_SIZE)
+                    
+                    # Connexion coupée avant la fin du Content-Length
+                    if response.length:
+                        raise http.client.IncompleteRead(b'', response.length)
+                    
+                    os.replace(partial_path, filepath)
+                except Exception:
+                    partial_path.unlink(missing_ok=True)
+                    raise
+                
+                self._record_download(url_key, filepath)
                 return True
                 
         except Exception as e:
@@ -449,6 +1080,98 @@ class RedditScraper:
                 print(f"   ❌ Erreur: {post.id} - {str(e)[:50]}")
             return False
     
+    @staticmethod
+    def _open_partial(path: Path, size: Optional[int]) -> BinaryIO:
+        """
+        Ouvre le fichier temporaire d'un téléchargement.
+        
+        Args:
+            path: Chemin du fichier .part
+            size: Taille annoncée (Content-Length), si connue
+            
+        Returns:
+            Fichier ouvert en écriture binaire, avec un tampon de _CHUNK_SIZE
+        """
+        f = open(path, 'wb', buffering=_CHUNK_SIZE)
+        
+        # Réserver l'espace disque d'un coup (limite la fragmentation)
+        if size and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                pass  # Non supporté par le système de fichiers
+        
+        return f
+    
+    def _record_result(self, post: RedditPost, success: Optional[bool]) -> None:
+        """
+        Met à jour les statistiques après un téléchargement.
+        
+        Args:
+            post: Post traité
+            success: Résultat du téléchargement (None si l'image était
+                déjà présente)
+        """
+        if success is None:
+            self.stats['skipped'] += 1
+            self.downloaded.add(post.id)
+        elif success:
+            self.stats['downloaded'] += 1
+            self.downloaded.add(post.id)
+        else:
+            self.stats['failed'] += 1
+            self.failed.add(post.id)
+    
+    def _print_progress(self, completed: int, total: int, last_print: float) -> float:
+        """
+        Affiche la barre de progression (limitée pour ne pas saturer stdout).
+        
+        Args:
+            completed: Téléchargements terminés
+            total: Téléchargements soumis
+            last_print: Instant du dernier affichage (time.monotonic)
+            
+        Returns:
+            Instant du dernier affichage, mis à jour si la barre a été redessinée
+        """
+        now = time.monotonic()
+        if not self.config.verbose or (
+            now - last_print < _PROGRESS_INTERVAL and completed != total
+        ):
+            return last_print
+        
+        pct = (completed / total) * 100
+        bar = '█' * int(pct // 5) + '░' * (20 - int(pct // 5))
+        print(f"\r   [{bar}] {pct:.0f}% ({completed}/{total})", end='')
+        return now
+    
+    def _wait_downloads(self, futures: Dict[Future, RedditPost]) -> None:
+        """
+        Attend la fin des téléchargements en affichant la progression.
+        
+        Args:
+            futures: Téléchargements soumis, associés à leur post
+        """
+        completed = 0
+        last_print = 0.0
+        
+        for future in as_completed(futures):
+            post = futures[future]
+            
+            try:
+                self._record_result(post, future.result())
+                
+                if self._index_unsaved >= _INDEX_FLUSH_EVERY:
+                    self._save_url_index()
+                
+                completed += 1
+                last_print = self._print_progress(completed, len(futures), last_print)
+                
+            except Exception:
+                self.stats['failed'] += 1
+        
+        print()  # Nouvelle ligne après la barre de progression
+    
     def download_all(self, posts: List[RedditPost]) -> None:
         """
         Télécharge toutes les images en parallèle.
@@ -463,40 +1186,202 @@ class RedditScraper:
         print(f"\n📥 Téléchargement de {len(posts)} images...")
         print(f"   Dossier: {self.output_path}")
         
-        completed = 0
-        
         with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
             futures = {
                 executor.submit(self._download_image, post): post 
                 for post in posts
             }
             
-            for future in as_completed(futures):
-                post = futures[future]
-                
+            self._wait_downloads(futures)
+    
+    def fetch_and_download(self) -> None:
+        """
+        Télécharge les images au fur et à mesure de la pagination.
+        
+        Chaque page analysée alimente immédiatement le pool de
+        téléchargement, ce qui masque la latence des requêtes de listing.
+        """
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            futures = {
+                executor.submit(self._download_image, post): post
+                for post in self.iter_posts()
+            }
+            
+            print(f"   ✅ {len(futures)} images trouvées")
+            
+            if not futures:
+                print("⚠️  Aucune image à télécharger")
+                return
+            
+            print(f"\n📥 Téléchargement de {len(futures)} images...")
+            print(f"   Dossier: {self.output_path}")
+            
+            self._wait_downloads(futures)
+    
+    async def _download_image_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        post: RedditPost
+    ) -> Optional[bool]:
+        """
+        Télécharge une image avec aiohttp.
+        
+        Args:
+            session: Session aiohttp partagée
+            semaphore: Limite globale de téléchargements simultanés
+            post: Post Reddit contenant l'URL
+            
+        Returns:
+            True si téléchargement réussi, False en cas d'échec,
+            None si l'image était déjà présente
+        """
+        import asyncio
+        
+        filepath = self.output_path / post.filename
+        url_key = _url_key(post.url)
+        
+        # Éviter les doublons (le contrôle d'un repost accède au disque)
+        if await asyncio.to_thread(self._is_known, post, url_key):
+            return None
+        
+        async with semaphore:
+            try:
+                async with session.get(post.url, headers=self.DOWNLOAD_HEADERS) as response:
+                    if response.status != 200:
+                        if self.config.verbose:
+                            print(f"   ❌ Erreur: {post.id} - HTTP {response.status}")
+                        return False
+                    
+                    # Vérifier le content-type
+                    content_type = response.headers.get('Content-Type', '')
+                    if not content_type.startswith('image/'):
+                        return False
+                    
+                    # Refuser les fichiers trop volumineux avant de les télécharger
+                    size = response.content_length
+                    if size and self.config.max_bytes and size > self.config.max_bytes:
+                        if self.config.verbose:
+                            print(f"   ⚠️  Ignorée: {post.id} - {size / (1024 * 1024):.1f} Mo")
+                        return False
+                    
+                    # Télécharger par blocs dans un fichier temporaire, renommé
+                    # seulement une fois complet (aiohttp lève une erreur si
+                    # la connexion est coupée avant la fin). Les accès disque
+                    # passent par des threads pour ne pas bloquer la boucle.
+                    partial_path = filepath.with_name(filepath.name + _PARTIAL_SUFFIX)
+                    try:
+                        f = await asyncio.to_thread(self._open_partial, partial_path, size)
+                        try:
+                            # Regrouper les blocs reçus: une écriture par _CHUNK_SIZE
+                            buffer = bytearray()
+                            async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                                buffer += chunk
+                                if len(buffer) >= _CHUNK_SIZE:
+                                    await asyncio.to_thread(f.write, bytes(buffer))
+                                    buffer.clear()
+                            
+                            if buffer:
+                                await asyncio.to_thread(f.write, bytes(buffer))
+                        finally:
+                            await asyncio.to_thread(f.close)
+                        
+                        await asyncio.to_thread(os.replace, partial_path, filepath)
+                    except Exception:
+                        await asyncio.to_thread(partial_path.unlink, missing_ok=True)
+                        raise
+                    
+                    # Le verrou de l'index peut être tenu par une sauvegarde en cours
+                    await asyncio.to_thread(self._record_download, url_key, filepath)
+                    return True
+                    
+            except Exception as e:
+                if self.config.verbose:
+                    print(f"   ❌ Erreur: {post.id} - {str(e)[:50]}")
+                return False
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Crée la session aiohttp (keep-alive, cache DNS, limite par hôte)."""
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.config.max_workers,
+            limit_per_host=MAX_PER_HOST,
+            ttl_dns_cache=300
+        )
+        
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': self.USER_AGENT},
+            # Proxys de l'environnement (HTTP_PROXY, HTTPS_PROXY, NO_PROXY),
+            # comme pour le listing via ConnectionPool
+            trust_env=True,
+            timeout=aiohttp.ClientTimeout(sock_connect=30, sock_read=30)
+        )
+    
+    async def _wait_downloads_async(self, tasks: Dict[asyncio.Task, RedditPost]) -> None:
+        """
+        Attend la fin des téléchargements asynchrones en affichant la progression.
+        
+        Args:
+            tasks: Téléchargements lancés, associés à leur post
+        """
+        import asyncio
+        
+        completed = 0
+        last_print = 0.0
+        pending = set(tasks)
+        
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            
+            for task in done:
                 try:
-                    success = future.result()
+                    self._record_result(tasks[task], task.result())
                     
-                    if success:
-                        self.stats['downloaded'] += 1
-                        self.downloaded.add(post.id)
-                    else:
-                        self.stats['failed'] += 1
-                        self.failed.add(post.id)
+                    # Écriture disque hors de la boucle d'événements
+                    if self._index_unsaved >= _INDEX_FLUSH_EVERY:
+                        await asyncio.to_thread(self._save_url_index)
                     
                     completed += 1
+                    last_print = self._print_progress(completed, len(tasks), last_print)
                     
-                    # Afficher la progression
-                    if self.config.verbose:
-                        pct = (completed / len(posts)) * 100
-                        bar = '█' * int(pct // 5) + '░' * (20 - int(pct // 5))
-                        print(f"\r   [{bar}] {pct:.0f}% ({completed}/{len(posts)})", end='')
-                    
-                except Exception as e:
+                except Exception:
                     self.stats['failed'] += 1
         
         print()  # Nouvelle ligne après la barre de progression
     
+    async def fetch_and_download_async(self) -> None:
+        """
+        Équivalent asynchrone de fetch_and_download().
+        
+        Le listing reste synchrone (requêtes chaînées): il avance dans un
+        thread pour ne pas bloquer la boucle d'événements pendant que les
+        téléchargements progressent.
+        """
+        import asyncio
+        
+        posts = self.iter_posts()
+        semaphore = asyncio.Semaphore(self.config.max_workers)
+        
+        async with self._create_session() as session:
+            tasks = {}
+            
+            while (post := await asyncio.to_thread(next, posts, None)) is not None:
+                task = asyncio.ensure_future(self._download_image_async(session, semaphore, post))
+                tasks[task] = post
+            
+            print(f"   ✅ {len(tasks)} images trouvées")
+            
+            if not tasks:
+                print("⚠️  Aucune image à télécharger")
+                return
+            
+            print(f"\n📥 Téléchargement de {len(tasks)} images...")
+            print(f"   Dossier: {self.output_path}")
+            
+            await self._wait_downloads_async(tasks)
+    
     def print_summary(self) -> None:
         """Affiche le résumé du scraping."""
         print("\n" + "═" * 60)
@@ -510,27 +1395,59 @@ class RedditScraper:
         print(f"   Dossier:         {self.output_path}")
         print("═" * 60)
     
+    def _finish(self, start_time: float) -> None:
+        """Sauvegarde l'index, affiche le résumé et libère les connexions."""
+        # Sauvegarder l'index des URLs
+        self._save_url_index()
+        
+        # Afficher le résumé
+        self.print_summary()
+        
+        self.pool.close()
+        
+        elapsed = time.time() - start_time
+        print(f"⏱️  Temps total: {elapsed:.1f}s")
+    
     def run(self) -> None:
         """Exécute le scraping complet."""
         start_time = time.time()
         
-        # Récupérer les posts
-        posts = self.fetch_posts()
+        # Ouvrir les connexions vers les hôtes d'images pendant le listing
+        self.pool.prime(self.PRIME_HOSTS)
         
-        # Télécharger les images
-        self.download_all(posts)
+        # Récupérer les posts et télécharger les images en parallèle
+        self.fetch_and_download()
         
-        # Afficher le résumé
-        self.print_summary()
+        self._finish(start_time)
+    
+    async def run_async(self) -> None:
+        """Exécute le scraping complet, téléchargements via aiohttp."""
+        start_time = time.time()
         
-        elapsed = time.time() - start_time
-        print(f"⏱️  Temps total: {elapsed:.1f}s")
+        # Récupérer les posts et télécharger les images de façon asynchrone
+        await self.fetch_and_download_async()
+        
+        self._finish(start_time)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Interface CLI
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _size_mb(value: str) -> float:
+    """Valide une taille en Mo (positive ou nulle) pour argparse."""
+    try:
+        size = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"taille invalide: {value!r}")
+    
+    # La comparaison rejette aussi NaN et l'infini
+    if not 0 <= size < float('inf'):
+        raise argparse.ArgumentTypeError(f"la taille doit être positive ou nulle: {value!r}")
+    
+    return size
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Crée le parser d'arguments CLI."""
     parser = argparse.ArgumentParser(
@@ -611,11 +1528,18 @@ Exemples:
         help="Re-télécharger les fichiers existants"
     )
     
+    parser.add_argument(
+        '--max-size',
+        type=_size_mb,
+        default=100,
+        help="Taille maximum d'un fichier en Mo, 0 pour illimitée (défaut: 100)"
+    )
+    
     parser.add_argument(
         '-w', '--workers',
         type=int,
-        default=5,
-        help="Nombre de téléchargements parallèles (défaut: 5)"
+        default=16,
+        help=f"Nombre de téléchargements parallèles, {MAX_WORKERS} maximum (défaut: 16)"
     )
     
     parser.add_argument(
@@ -639,6 +1563,11 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
     
+    # Plafonner le nombre de workers
+    workers = max(1, min(args.workers, MAX_WORKERS))
+    if workers != args.workers:
+        print(f"⚠️  --workers ramené à {workers} (entre 1 et {MAX_WORKERS})")
+    
     # Créer la configuration
     config = ScraperConfig(
         subreddit=args.subreddit.replace('r/', ''),
@@ -651,13 +1580,18 @@ def main():
         min_height=args.min_height,
         include_nsfw=args.nsfw,
         skip_existing=not args.no_skip,
-        max_workers=args.workers,
+        max_workers=workers,
+        max_bytes=int(args.max_size * 1024 * 1024),
         verbose=not args.quiet
     )
     
     # Exécuter le scraper
     scraper = RedditScraper(config)
-    scraper.run()
+    if _has_aiohttp():
+        import asyncio
+        asyncio.run(scraper.run_async())
+    else:
+        scraper.run()
 
 
 if __name__ == "__main__":